@@ -1,15 +1,25 @@
-import json
+import asyncio
+import bisect
+import functools
+import itertools
 import logging
+import operator
 import os
 import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone, tzinfo
 
 import httpx
+import orjson
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
 from telegram import Update
+from telegram.error import RetryAfter
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CommandHandler,
     ContextTypes,
@@ -28,16 +38,72 @@ DGS_API_KEY = os.environ.get("DGS_API_KEY", "")
 
 WEATHER_API_URL = "https://api-open.data.gov.sg/v2/real-time/api/two-hr-forecast"
 UV_API_URL = "https://api-open.data.gov.sg/v2/real-time/api/uv"
+# Singapore has a fixed UTC+8 offset with no DST, so no tz database is needed
+SGT = timezone(timedelta(hours=8))
 
 DB_PATH = "subscribers.db"
 
 
-def get_db_connection() -> sqlite3.Connection:
-    """Get a database connection with foreign keys enabled."""
-    conn = sqlite3.connect(DB_PATH)
+# Connections live for the lifetime of the process. All writes go through one
+# writer connection, opened by init_db() and guarded by _db_lock. Reads use a
+# per-thread read-only connection; under WAL they see the last committed state
+# and never wait on the writer.
+_db: sqlite3.Connection | None = None
+_db_lock = threading.Lock()
+_db_readers = threading.local()
+_db_reader_conns: list[sqlite3.Connection] = []
+
+
+def open_db_connection(read_only: bool = False) -> sqlite3.Connection:
+    """Open a database connection with foreign keys enabled and performance PRAGMAs applied."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.execute("PRAGMA foreign_keys = ON")
+    # WAL lets readers proceed while a write is in progress and avoids the
+    # rollback journal's double write; NORMAL sync is safe under WAL.
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -8000")  # 8 MB; the whole database fits
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+    conn.execute("PRAGMA busy_timeout = 5000")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
     return conn
 
+
+@contextmanager
+def get_db_connection() -> Iterator[sqlite3.Connection]:
+    """Yield the writer connection inside a transaction.
+
+    Commits when the block exits normally and rolls back if it raises.
+    """
+    with _db_lock, _db:
+        yield _db
+
+
+@contextmanager
+def get_read_connection() -> Iterator[sqlite3.Connection]:
+    """Yield the calling thread's read-only connection, opening it on first use."""
+    conn = getattr(_db_readers, "conn", None)
+    if conn is None:
+        conn = open_db_connection(read_only=True)
+        _db_readers.conn = conn
+        with _db_lock:
+            _db_reader_conns.append(conn)
+    yield conn
+
+
+def close_db() -> None:
+    """Close the writer and all reader connections."""
+    global _db
+    with _db_lock:
+        for conn in _db_reader_conns:
+            conn.close()
+        _db_reader_conns.clear()
+        if _db is not None:
+            _db.close()
+            _db = None
+
 FORECAST_EMOJI = {
     "Fair": "☀️",
     "Fair (Day)": "☀️",
@@ -65,6 +131,16 @@ FORECAST_EMOJI = {
 }
 
 
+def normalize_forecast(forecast: str) -> str:
+    """Normalize a forecast description for lookup: lowercase, single-spaced."""
+    return " ".join(forecast.split()).lower()
+
+
+# Normalized-key copy so lookups tolerate casing and whitespace differences from the API
+_FORECAST_EMOJI_NORM = {normalize_forecast(k): v for k, v in FORECAST_EMOJI.items()}
+_unknown_forecasts: set[str] = set()
+
+
 # ---------------------------------------------------------------------------
 # Database helpers
 # ---------------------------------------------------------------------------
@@ -74,7 +150,8 @@ MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
 
 def init_db():
     """Initialize database by running pending migrations using PRAGMA user_version."""
-    conn = get_db_connection()
+    global _db
+    _db = conn = open_db_connection()
     cursor = conn.cursor()
 
     # Get current database version
@@ -96,7 +173,6 @@ def init_db():
     # Load and sort migration files
     if not os.path.exists(MIGRATIONS_DIR):
         logger.warning("Migrations directory not found: %s", MIGRATIONS_DIR)
-        conn.close()
         return
 
     migration_files = sorted([f for f in os.listdir(MIGRATIONS_DIR) if f.endswith(".sql")])
@@ -130,54 +206,48 @@ def init_db():
             # The raise below ensures the error is surfaced to the caller.
             conn.rollback()
             raise
-    
-    conn.close()
+
     logger.info("Database initialization complete")
 
 
 SUBSCRIBER_LIMIT = 100
 
 
-def add_subscriber(chat_id: int, area: str) -> bool | None:
+def add_subscriber(
+    chat_id: int, area: str, last_sent_at: str | None = None, next_scheduled_at: str | None = None
+) -> tuple[bool | None, bool]:
     """Add an area to a subscriber's list.
 
+    A new subscriber's row is created with last_sent_at and next_scheduled_at;
+    an existing subscriber keeps their schedule.
+
     Returns:
+        (inserted, is_new_subscriber), where inserted is
         True  - area successfully added (new user or new area)
         False - area already in subscriber's list
         None  - subscriber limit reached (chat_id is not yet in DB)
+        and is_new_subscriber is True only when this call created the chat's row.
     """
-    conn = get_db_connection()
-    row = conn.execute(
-        "SELECT areas FROM subscribers WHERE chat_id = ?", (chat_id,)
-    ).fetchone()
-
-    if row is None:
-        # New user: check global limit first
-        count = conn.execute("SELECT COUNT(*) FROM subscribers").fetchone()[0]
-        if count >= SUBSCRIBER_LIMIT:
-            conn.close()
-            return None
-        conn.execute(
-            "INSERT INTO subscribers (chat_id, areas) VALUES (?, ?)",
-            (chat_id, json.dumps([area])),
-        )
-        conn.commit()
-        conn.close()
-        return True
+    with get_db_connection() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM subscribers WHERE chat_id = ?", (chat_id,)
+        ).fetchone()
 
-    # Existing user: append area if not already present
-    areas = json.loads(row[0])
-    if area in areas:
-        conn.close()
-        return False
-    areas.append(area)
-    conn.execute(
-        "UPDATE subscribers SET areas = ? WHERE chat_id = ?",
-        (json.dumps(sorted(areas)), chat_id),
-    )
-    conn.commit()
-    conn.close()
-    return True
+        if row is None:
+            # New user: check global limit first
+            count = conn.execute("SELECT COUNT(*) FROM subscribers").fetchone()[0]
+            if count >= SUBSCRIBER_LIMIT:
+                return None, False
+            conn.execute(
+                "INSERT INTO subscribers (chat_id, last_sent_at, next_scheduled_at) VALUES (?, ?, ?)",
+                (chat_id, last_sent_at, next_scheduled_at),
+            )
+
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO subscriber_areas (chat_id, area) VALUES (?, ?)",
+            (chat_id, area),
+        )
+        return cursor.rowcount == 1, row is None
 
 
 def remove_subscriber(chat_id: int, area: str) -> bool:
@@ -185,70 +255,128 @@ def remove_subscriber(chat_id: int, area: str) -> bool:
 
     Returns True if the area was found and removed, False otherwise.
     """
-    conn = get_db_connection()
-    row = conn.execute(
-        "SELECT areas FROM subscribers WHERE chat_id = ?", (chat_id,)
-    ).fetchone()
-
-    if row is None:
-        conn.close()
-        return False
-
-    areas = json.loads(row[0])
-    if area not in areas:
-        conn.close()
-        return False
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "DELETE FROM subscriber_areas WHERE chat_id = ? AND area = ?", (chat_id, area)
+        )
+        if cursor.rowcount == 0:
+            return False
 
-    areas.remove(area)
-    if not areas:
-        conn.execute("DELETE FROM subscribers WHERE chat_id = ?", (chat_id,))
-    else:
         conn.execute(
-            "UPDATE subscribers SET areas = ? WHERE chat_id = ?",
-            (json.dumps(areas), chat_id),
+            "DELETE FROM subscribers WHERE chat_id = ? "
+            "AND NOT EXISTS (SELECT 1 FROM subscriber_areas WHERE chat_id = ?)",
+            (chat_id, chat_id),
         )
-    conn.commit()
-    conn.close()
-    return True
+        return True
 
 
 def get_subscriptions(chat_id: int) -> list[str]:
     """Return all subscribed area names for a chat."""
-    conn = get_db_connection()
-    row = conn.execute(
-        "SELECT areas FROM subscribers WHERE chat_id = ?", (chat_id,)
-    ).fetchone()
-    conn.close()
-    return json.loads(row[0]) if row else []
+    with get_read_connection() as conn:
+        return [
+            row[0]
+            for row in conn.execute(
+                "SELECT area FROM subscriber_areas WHERE chat_id = ? ORDER BY area", (chat_id,)
+            )
+        ]
+
+
+def group_areas_by_chat(rows: Iterable[tuple[int, str]]) -> list[tuple[int, list[str]]]:
+    """Group (chat_id, area) rows ordered by chat_id into (chat_id, areas) tuples."""
+    return [
+        (chat_id, [area for _, area in group])
+        for chat_id, group in itertools.groupby(rows, key=operator.itemgetter(0))
+    ]
 
 
 def get_all_subscribers() -> list[tuple[int, list[str]]]:
-    conn = get_db_connection()
-    rows = conn.execute("SELECT chat_id, areas FROM subscribers").fetchall()
-    conn.close()
-    return [(chat_id, json.loads(areas)) for chat_id, areas in rows]
-
-
-def update_subscriber_timestamps(chat_id: int, last_sent_at: str, next_scheduled_at: str):
-    """Update the last_sent_at and next_scheduled_at timestamps for a subscriber."""
-    conn = get_db_connection()
-    conn.execute(
-        "UPDATE subscribers SET last_sent_at = ?, next_scheduled_at = ? WHERE chat_id = ?",
-        (last_sent_at, next_scheduled_at, chat_id),
-    )
-    conn.commit()
-    conn.close()
+    with get_read_connection() as conn:
+        return group_areas_by_chat(
+            conn.execute("SELECT chat_id, area FROM subscriber_areas ORDER BY chat_id, area")
+        )
+
+
+def update_subscriber_timestamps_many(updates: list[tuple[str, str, int]]) -> None:
+    """Update timestamps for many subscribers in a single transaction.
+
+    Each item is a (last_sent_at, next_scheduled_at, chat_id) tuple.
+    """
+    with get_db_connection() as conn:
+        conn.executemany(
+            "UPDATE subscribers SET last_sent_at = ?, next_scheduled_at = ? WHERE chat_id = ?",
+            updates,
+        )
 
 
 def get_overdue_subscribers(now_iso: str) -> list[tuple[int, list[str]]]:
     """Get subscribers whose next_scheduled_at is due (<= now)."""
-    conn = get_db_connection()
-    rows = conn.execute(
-        "SELECT chat_id, areas FROM subscribers WHERE next_scheduled_at IS NULL OR next_scheduled_at <= ?",
-        (now_iso,),
-    ).fetchall()
-    conn.close()
-    return [(chat_id, json.loads(areas)) for chat_id, areas in rows]
+    with get_read_connection() as conn:
+        return group_areas_by_chat(
+            conn.execute(
+                "SELECT s.chat_id, a.area FROM subscribers s "
+                "JOIN subscriber_areas a ON a.chat_id = s.chat_id "
+                "WHERE s.next_scheduled_at IS NULL OR s.next_scheduled_at <= ? "
+                "ORDER BY s.chat_id, a.area",
+                (now_iso,),
+            )
+        )
+
+
+def get_next_scheduled_time(now_iso: str) -> str | None:
+    """Get when the next subscriber is due.
+
+    Returns now_iso if any subscriber is already due (no next_scheduled_at, or
+    one in the past), otherwise the earliest future next_scheduled_at, or None
+    if there are no subscribers.
+    """
+    with get_read_connection() as conn:
+        return conn.execute(
+            """
+            SELECT CASE
+                WHEN EXISTS (
+                    SELECT 1 FROM subscribers
+                    WHERE next_scheduled_at IS NULL OR next_scheduled_at <= :now
+                ) THEN :now
+                ELSE (SELECT MIN(next_scheduled_at) FROM subscribers WHERE next_scheduled_at > :now)
+            END
+            """,
+            {"now": now_iso},
+        ).fetchone()[0]
+
+
+# Async wrappers for use from handlers and scheduled jobs. They run the blocking
+# SQLite helpers in a worker thread so commits don't stall the event loop.
+
+async def add_subscriber_async(
+    chat_id: int, area: str, last_sent_at: str | None = None, next_scheduled_at: str | None = None
+) -> tuple[bool | None, bool]:
+    """Run add_subscriber() in a worker thread."""
+    return await asyncio.to_thread(add_subscriber, chat_id, area, last_sent_at, next_scheduled_at)
+
+
+async def remove_subscriber_async(chat_id: int, area: str) -> bool:
+    """Run remove_subscriber() in a worker thread."""
+    return await asyncio.to_thread(remove_subscriber, chat_id, area)
+
+
+async def get_subscriptions_async(chat_id: int) -> list[str]:
+    """Run get_subscriptions() in a worker thread."""
+    return await asyncio.to_thread(get_subscriptions, chat_id)
+
+
+async def update_subscriber_timestamps_many_async(updates: list[tuple[str, str, int]]) -> None:
+    """Run update_subscriber_timestamps_many() in a worker thread."""
+    await asyncio.to_thread(update_subscriber_timestamps_many, updates)
+
+
+async def get_overdue_subscribers_async(now_iso: str) -> list[tuple[int, list[str]]]:
+    """Run get_overdue_subscribers() in a worker thread."""
+    return await asyncio.to_thread(get_overdue_subscribers, now_iso)
+
+
+async def get_next_scheduled_time_async(now_iso: str) -> str | None:
+    """Run get_next_scheduled_time() in a worker thread."""
+    return await asyncio.to_thread(get_next_scheduled_time, now_iso)
 
 
 # ---------------------------------------------------------------------------
@@ -257,12 +385,11 @@ def get_overdue_subscribers(now_iso: str) -> list[tuple[int, list[str]]]:
 
 def get_trivia_by_id(trivia_id: int) -> dict | None:
     """Get a trivia item by ID."""
-    conn = get_db_connection()
-    row = conn.execute(
-        "SELECT id, text, source_url FROM trivia WHERE id = ?",
-        (trivia_id,)
-    ).fetchone()
-    conn.close()
+    with get_read_connection() as conn:
+        row = conn.execute(
+            "SELECT id, text, source_url FROM trivia WHERE id = ?",
+            (trivia_id,)
+        ).fetchone()
     if row:
         return {"id": row[0], "text": row[1], "source_url": row[2]}
     return None
@@ -270,52 +397,60 @@ def get_trivia_by_id(trivia_id: int) -> dict | None:
 
 def get_trivia_count() -> int:
     """Get the total count of trivia items."""
-    conn = get_db_connection()
-    count = conn.execute("SELECT COUNT(*) FROM trivia").fetchone()[0]
-    conn.close()
+    with get_read_connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM trivia").fetchone()[0]
     return count
 
 
 def get_all_trivia_ids() -> list[int]:
     """Get all trivia IDs in ascending order."""
-    conn = get_db_connection()
-    rows = conn.execute("SELECT id FROM trivia ORDER BY id").fetchall()
-    conn.close()
-    return [row[0] for row in rows]
+    with get_read_connection() as conn:
+        return [row[0] for row in conn.execute("SELECT id FROM trivia ORDER BY id")]
+
+
+def get_trivia_by_ids(trivia_ids: Iterable[int]) -> dict[int, dict]:
+    """Get several trivia items in one query, keyed by ID."""
+    trivia_ids = list(trivia_ids)
+    if not trivia_ids:
+        return {}
+    placeholders = ", ".join("?" * len(trivia_ids))
+    with get_read_connection() as conn:
+        rows = conn.execute(
+            f"SELECT id, text, source_url FROM trivia WHERE id IN ({placeholders})",
+            trivia_ids,
+        )
+        return {row[0]: {"id": row[0], "text": row[1], "source_url": row[2]} for row in rows}
 
 
-def get_next_trivia_id(last_id: int | None) -> int | None:
+def get_next_trivia_id(last_id: int | None, trivia_ids: list[int] | None = None) -> int | None:
     """Get the next trivia ID after last_id, wrapping around if needed.
 
     Handles non-contiguous IDs by finding the next ID greater than last_id,
-    or wrapping to the first ID if at the end.
+    or wrapping to the first ID if at the end. Pass trivia_ids (ascending, as
+    returned by get_all_trivia_ids()) to avoid a query when calling in a loop.
 
     Returns None if no trivia exists.
     """
-    trivia_ids = get_all_trivia_ids()
+    if trivia_ids is None:
+        trivia_ids = get_all_trivia_ids()
     if not trivia_ids:
         return None
 
     if last_id is None:
         return trivia_ids[0]
 
-    # Find the next ID after last_id
-    for tid in trivia_ids:
-        if tid > last_id:
-            return tid
-
-    # Wrap around to the first ID
-    return trivia_ids[0]
+    # Find the next ID after last_id, wrapping around to the first ID
+    i = bisect.bisect_right(trivia_ids, last_id)
+    return trivia_ids[i] if i < len(trivia_ids) else trivia_ids[0]
 
 
 def get_trivia_subscription(chat_id: int) -> dict | None:
     """Get trivia subscription status for a chat."""
-    conn = get_db_connection()
-    row = conn.execute(
-        "SELECT trivia_enabled, last_sent_trivia_id FROM trivia_subscriptions WHERE chat_id = ?",
-        (chat_id,)
-    ).fetchone()
-    conn.close()
+    with get_read_connection() as conn:
+        row = conn.execute(
+            "SELECT trivia_enabled, last_sent_trivia_id FROM trivia_subscriptions WHERE chat_id = ?",
+            (chat_id,)
+        ).fetchone()
     if row:
         return {"trivia_enabled": bool(row[0]), "last_sent_trivia_id": row[1]}
     return None
@@ -323,47 +458,89 @@ def get_trivia_subscription(chat_id: int) -> dict | None:
 
 def set_trivia_enabled(chat_id: int, enabled: bool) -> bool:
     """Enable or disable trivia for a chat. Returns True if successful."""
-    conn = get_db_connection()
-    # Check if subscription exists
-    existing = conn.execute(
-        "SELECT 1 FROM trivia_subscriptions WHERE chat_id = ?",
-        (chat_id,)
-    ).fetchone()
-    
-    if existing:
-        conn.execute(
-            "UPDATE trivia_subscriptions SET trivia_enabled = ? WHERE chat_id = ?",
-            (1 if enabled else 0, chat_id)
-        )
-    else:
+    with get_db_connection() as conn:
         conn.execute(
-            "INSERT INTO trivia_subscriptions (chat_id, trivia_enabled, last_sent_trivia_id) VALUES (?, ?, ?)",
-            (chat_id, 1 if enabled else 0, None)
+            "INSERT INTO trivia_subscriptions (chat_id, trivia_enabled, last_sent_trivia_id) VALUES (?, ?, NULL) "
+            "ON CONFLICT (chat_id) DO UPDATE SET trivia_enabled = excluded.trivia_enabled",
+            (chat_id, 1 if enabled else 0)
         )
-    conn.commit()
-    conn.close()
     return True
 
 
 def update_last_sent_trivia(chat_id: int, trivia_id: int) -> None:
     """Update the last sent trivia ID for a chat."""
-    conn = get_db_connection()
-    conn.execute(
-        "UPDATE trivia_subscriptions SET last_sent_trivia_id = ? WHERE chat_id = ?",
-        (trivia_id, chat_id)
-    )
-    conn.commit()
-    conn.close()
+    with get_db_connection() as conn:
+        conn.execute(
+            "UPDATE trivia_subscriptions SET last_sent_trivia_id = ? WHERE chat_id = ?",
+            (trivia_id, chat_id)
+        )
+
+
+def update_last_sent_trivia_many(updates: list[tuple[int, int]]) -> None:
+    """Update the last sent trivia ID for many chats in a single transaction.
+
+    Each item is a (trivia_id, chat_id) tuple.
+    """
+    with get_db_connection() as conn:
+        conn.executemany(
+            "UPDATE trivia_subscriptions SET last_sent_trivia_id = ? WHERE chat_id = ?",
+            updates,
+        )
 
 
 def get_trivia_enabled_subscribers() -> list[tuple[int, int | None]]:
     """Get all subscribers with trivia enabled and their last sent trivia ID."""
-    conn = get_db_connection()
-    rows = conn.execute(
-        "SELECT chat_id, last_sent_trivia_id FROM trivia_subscriptions WHERE trivia_enabled = 1"
-    ).fetchall()
-    conn.close()
-    return [(chat_id, last_id) for chat_id, last_id in rows]
+    with get_read_connection() as conn:
+        return conn.execute(
+            "SELECT chat_id, last_sent_trivia_id FROM trivia_subscriptions WHERE trivia_enabled = 1"
+        ).fetchall()
+
+
+# Async wrappers for the trivia helpers, as for the subscriber helpers above
+
+async def get_trivia_by_id_async(trivia_id: int) -> dict | None:
+    """Run get_trivia_by_id() in a worker thread."""
+    return await asyncio.to_thread(get_trivia_by_id, trivia_id)
+
+
+async def get_all_trivia_ids_async() -> list[int]:
+    """Run get_all_trivia_ids() in a worker thread."""
+    return await asyncio.to_thread(get_all_trivia_ids)
+
+
+async def get_trivia_by_ids_async(trivia_ids: Iterable[int]) -> dict[int, dict]:
+    """Run get_trivia_by_ids() in a worker thread."""
+    return await asyncio.to_thread(get_trivia_by_ids, trivia_ids)
+
+
+async def get_next_trivia_id_async(last_id: int | None) -> int | None:
+    """Run get_next_trivia_id() in a worker thread."""
+    return await asyncio.to_thread(get_next_trivia_id, last_id)
+
+
+async def get_trivia_subscription_async(chat_id: int) -> dict | None:
+    """Run get_trivia_subscription() in a worker thread."""
+    return await asyncio.to_thread(get_trivia_subscription, chat_id)
+
+
+async def set_trivia_enabled_async(chat_id: int, enabled: bool) -> bool:
+    """Run set_trivia_enabled() in a worker thread."""
+    return await asyncio.to_thread(set_trivia_enabled, chat_id, enabled)
+
+
+async def update_last_sent_trivia_async(chat_id: int, trivia_id: int) -> None:
+    """Run update_last_sent_trivia() in a worker thread."""
+    await asyncio.to_thread(update_last_sent_trivia, chat_id, trivia_id)
+
+
+async def update_last_sent_trivia_many_async(updates: list[tuple[int, int]]) -> None:
+    """Run update_last_sent_trivia_many() in a worker thread."""
+    await asyncio.to_thread(update_last_sent_trivia_many, updates)
+
+
+async def get_trivia_enabled_subscribers_async() -> list[tuple[int, int | None]]:
+    """Run get_trivia_enabled_subscribers() in a worker thread."""
+    return await asyncio.to_thread(get_trivia_enabled_subscribers)
 
 
 # ---------------------------------------------------------------------------
@@ -373,10 +550,47 @@ def get_trivia_enabled_subscribers() -> list[tuple[int, int | None]]:
 _forecast_cache: dict | None = None
 _forecast_cache_expiry: datetime | None = None
 _FORECAST_CACHE_TTL_SECONDS = 1800  # 30 minutes
+# Serialises cache refreshes so concurrent handlers share a single API call
+_forecast_lock = asyncio.Lock()
 
 _uv_cache: dict | None = None
 _uv_cache_expiry: datetime | None = None
 _UV_CACHE_TTL_SECONDS = 1800  # 30 minutes
+_uv_lock = asyncio.Lock()
+
+# Shared HTTP client, created on first use (or in post_init) and closed in
+# post_shutdown so the TCP/TLS connection to data.gov.sg is reused across fetches.
+_http_client: httpx.AsyncClient | None = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used for all data.gov.sg requests."""
+    return httpx.AsyncClient(
+        headers={"x-api-key": DGS_API_KEY} if DGS_API_KEY else {},
+        limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+        timeout=httpx.Timeout(15.0, connect=5.0),
+        http2=True,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = create_http_client()
+    return _http_client
+
+
+def slim_forecast(result: dict) -> dict:
+    """Keep only the parts of a forecast response the bot reads.
+
+    Drops older forecast items and per-area coordinates so the full decoded
+    payload can be freed while the slim copy sits in the cache.
+    """
+    return {
+        "items": result.get("items", [])[-1:],
+        "area_metadata": [{"name": m["name"]} for m in result.get("area_metadata", [])],
+    }
 
 
 async def fetch_forecast() -> dict | None:
@@ -385,23 +599,25 @@ async def fetch_forecast() -> dict | None:
     if _forecast_cache and _forecast_cache_expiry and datetime.now(timezone.utc) < _forecast_cache_expiry:
         return _forecast_cache
 
-    headers = {}
-    if DGS_API_KEY:
-        headers["x-api-key"] = DGS_API_KEY
+    async with _forecast_lock:
+        # Another coroutine may have refreshed the cache while we waited
+        if _forecast_cache and _forecast_cache_expiry and datetime.now(timezone.utc) < _forecast_cache_expiry:
+            return _forecast_cache
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(WEATHER_API_URL, headers=headers, timeout=15)
+        resp = await get_http_client().get(WEATHER_API_URL)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
-    if data.get("code") != 0:
-        logger.error("Weather API error: %s", data.get("errorMsg"))
-        return None
+        if data.get("code") != 0:
+            logger.error("Weather API error: %s", data.get("errorMsg"))
+            return None
 
-    result = data.get("data")
-    _forecast_cache = result
-    _forecast_cache_expiry = datetime.now(timezone.utc) + timedelta(seconds=_FORECAST_CACHE_TTL_SECONDS) if result else None
-    return _forecast_cache
+        result = data.get("data")
+        if result:
+            result = slim_forecast(result)
+        _forecast_cache = result
+        _forecast_cache_expiry = datetime.now(timezone.utc) + timedelta(seconds=_FORECAST_CACHE_TTL_SECONDS) if result else None
+        return _forecast_cache
 
 
 async def fetch_uv_index() -> dict | None:
@@ -410,23 +626,23 @@ async def fetch_uv_index() -> dict | None:
     if _uv_cache and _uv_cache_expiry and datetime.now(timezone.utc) < _uv_cache_expiry:
         return _uv_cache
 
-    headers = {}
-    if DGS_API_KEY:
-        headers["x-api-key"] = DGS_API_KEY
+    async with _uv_lock:
+        # Another coroutine may have refreshed the cache while we waited
+        if _uv_cache and _uv_cache_expiry and datetime.now(timezone.utc) < _uv_cache_expiry:
+            return _uv_cache
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(UV_API_URL, headers=headers, timeout=15)
+        resp = await get_http_client().get(UV_API_URL)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
-    if data.get("code") != 0:
-        logger.error("UV API error: %s", data.get("errorMsg"))
-        return None
+        if data.get("code") != 0:
+            logger.error("UV API error: %s", data.get("errorMsg"))
+            return None
 
-    result = data.get("data")
-    _uv_cache = result
-    _uv_cache_expiry = datetime.now(timezone.utc) + timedelta(seconds=_UV_CACHE_TTL_SECONDS) if result else None
-    return _uv_cache
+        result = data.get("data")
+        _uv_cache = result
+        _uv_cache_expiry = datetime.now(timezone.utc) + timedelta(seconds=_UV_CACHE_TTL_SECONDS) if result else None
+        return _uv_cache
 
 
 def get_current_uv_index(uv_data: dict | None) -> int | None:
@@ -445,84 +661,97 @@ def get_current_uv_index(uv_data: dict | None) -> int | None:
     return latest_index.get("value")
 
 
-def find_area_forecast(data: dict, area: str) -> str | None:
-    items = data.get("items", [])
-    if not items:
-        return None
-    latest = items[-1]
-    for fc in latest.get("forecasts", []):
-        if fc["area"].lower() == area.lower():
-            return fc["forecast"]
-    return None
+def get_latest_item(data: dict) -> dict:
+    """Return the latest forecast item, or {} if the response has none."""
+    items = data.get("items")
+    return items[-1] if items else {}
 
 
 def get_valid_period_text(data: dict) -> str:
-    items = data.get("items", [])
-    if not items:
-        return ""
-    latest = items[-1]
-    vp = latest.get("valid_period", {})
-    return vp.get("text", "")
+    return get_latest_item(data).get("valid_period", {}).get("text", "")
 
 
 def get_validity_timestamps(data: dict) -> tuple[str | None, str | None]:
-    """Extract validity period start and end from forecast data in UTC ISO format."""
-    items = data.get("items", [])
-    if not items:
-        return None, None
-    latest = items[-1]
-    vp = latest.get("valid_period", {})
+    """Extract validity period start and end from forecast data in UTC ISO format.
+
+    The result is stored on the response dict, so each cached forecast is parsed once.
+    """
+    validity = data.get("_validity")
+    if validity is None:
+        validity = _parse_validity_timestamps(data)
+        data["_validity"] = validity
+    return validity
+
+
+def _parse_validity_timestamps(data: dict) -> tuple[str | None, str | None]:
+    vp = get_latest_item(data).get("valid_period", {})
     start_str = vp.get("start")
     end_str = vp.get("end")
     if start_str and end_str:
-        # astimezone handles both offset-aware and naive strings correctly,
-        # without clobbering any timezone already embedded in the ISO string.
-        start_utc = datetime.fromisoformat(start_str).astimezone(timezone.utc)
-        end_utc = datetime.fromisoformat(end_str).astimezone(timezone.utc)
-        return start_utc.isoformat(), end_utc.isoformat()
+        return _sgt_to_utc_iso(start_str), _sgt_to_utc_iso(end_str)
     return None, None
 
 
+def _sgt_to_utc_iso(value: str) -> str:
+    """Convert an API timestamp to UTC ISO format, reading naive times as SGT."""
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=SGT)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
 def calculate_next_scheduled_time(current_time: datetime) -> str:
     """Calculate next scheduled time.
     
     Rounds current time down to nearest :30 and adds 2 hours.
     This creates validity windows like 12:30am-2:30am, 2:30am-4:30am, etc.
     """
-    # Round down to nearest :30
-    if current_time.minute >= 30:
-        rounded = current_time.replace(minute=30, second=0, microsecond=0)
-    else:
-        rounded = current_time.replace(minute=0, second=0, microsecond=0)
-    
+    # Round down to nearest :30 (an epoch multiple of 30 minutes)
+    bucket = int(current_time.timestamp()) // 1800 * 1800
+    return _next_scheduled_for_bucket(bucket, current_time.tzinfo)
+
+
+@functools.lru_cache(maxsize=4)
+def _next_scheduled_for_bucket(bucket: int, tz: tzinfo | None) -> str:
     # Add 2 hours to get to the start of the next window
-    next_scheduled = rounded + timedelta(hours=2)
-    return next_scheduled.isoformat()
+    return datetime.fromtimestamp(bucket + 7200, tz).isoformat()
 
 
-def get_all_area_names(data: dict) -> list[str]:
-    return sorted(m["name"] for m in data.get("area_metadata", []))
+def get_all_area_names(data: dict) -> tuple[str, ...]:
+    return tuple(sorted(m["name"] for m in data.get("area_metadata", [])))
 
 
 # Cache for area names (unlikely to change often)
-_area_names_cache: list[str] = []
+_area_names_cache: tuple[str, ...] = ()
+_area_names_casefold_map: dict[str, str] = {}  # casefolded name -> canonical name
+_area_names_rendered: str = ""  # /areas reply text
 _area_names_cache_time: float = 0
 _AREA_NAMES_TTL = 86400  # 24 hours
 
 
-async def get_cached_area_names() -> list[str] | None:
+async def get_cached_area_names() -> tuple[str, ...] | None:
     """Return cached area names, refreshing from the API if stale."""
-    global _area_names_cache, _area_names_cache_time
+    global _area_names_cache, _area_names_casefold_map, _area_names_rendered, _area_names_cache_time
     if _area_names_cache and (time.monotonic() - _area_names_cache_time) < _AREA_NAMES_TTL:
         return _area_names_cache
     data = await fetch_forecast()
     if data is None:
         return _area_names_cache or None
     _area_names_cache = get_all_area_names(data)
+    _area_names_casefold_map = {name.casefold(): name for name in _area_names_cache}
+    _area_names_rendered = "Available areas:\n\n" + "\n".join("• " + n for n in _area_names_cache)
     _area_names_cache_time = time.monotonic()
     return _area_names_cache
 
 
+def match_area_name(area: str) -> str | None:
+    """Return the canonical area name matching area case-insensitively.
+
+    Uses the map built by get_cached_area_names(), so call that first.
+    """
+    return _area_names_casefold_map.get(area.casefold())
+
+
 def escape_markdown(text: str) -> str:
     """Escape Markdown special characters for Telegram's Markdown V1 parser."""
     # Telegram Markdown V1 special characters: * _ ` [
@@ -538,15 +767,69 @@ def format_trivia_message(trivia: dict) -> str:
     return f"Trivia of the week:\n\n{escaped_text}\n\nSource: {trivia['source_url']}"
 
 
-def format_forecast_message(area: str, forecast: str, uv_index: int | None = None) -> str:
-    emoji = FORECAST_EMOJI.get(forecast, "")
-    lines = [
-        f"{emoji} *{area}*",
-        f"2hr Forecast: *{forecast}*",
-    ]
-    if uv_index is not None:
-        lines.append(f"Current UV Index: *{uv_index}*")
-    return "\n".join(lines)
+def format_uv_line(uv_index: int | None) -> str:
+    """Format the UV index line appended to each forecast, or "" if unknown.
+
+    The UV index is shared by every area in a reply or broadcast, so render
+    this once and pass it to format_forecast_message().
+    """
+    if uv_index is None:
+        return ""
+    return f"\nCurrent UV Index: *{uv_index}*"
+
+
+def forecast_emoji(forecast: str) -> str:
+    """Return the emoji for a forecast description, or "" if it is unknown.
+
+    Unknown descriptions are logged once so new API wording can be added to FORECAST_EMOJI.
+    """
+    emoji = FORECAST_EMOJI.get(forecast) or _FORECAST_EMOJI_NORM.get(normalize_forecast(forecast))
+    if emoji is None:
+        if forecast not in _unknown_forecasts:
+            _unknown_forecasts.add(forecast)
+            logger.warning("No emoji for forecast %r", forecast)
+        return ""
+    return emoji
+
+
+def format_forecast_message(area: str, forecast: str, uv_line: str = "") -> str:
+    emoji = forecast_emoji(forecast)
+    return f"{emoji} *{area}*\n2hr Forecast: *{forecast}*{uv_line}"
+
+
+def get_forecast_messages(data: dict) -> dict[str, str]:
+    """Map area names to their rendered forecast message in the latest forecast item.
+
+    Each area is keyed both by its canonical name and by its casefolded name;
+    see lookup_area_message(). Messages carry no UV line, so append
+    format_uv_line() to each one when sending.
+
+    The map is built on first use and stored on the response dict, so every
+    handler and scheduled run sharing the cached response renders each area's
+    emoji and message once rather than once per subscriber.
+    """
+    messages = data.get("_forecast_messages")
+    if messages is None:
+        forecasts = get_latest_item(data).get("forecasts", [])
+        messages = {}
+        for fc in forecasts:
+            message = format_forecast_message(fc["area"], fc["forecast"])
+            messages[fc["area"]] = message
+            messages[fc["area"].casefold()] = message
+        data["_forecast_messages"] = messages
+    return messages
+
+
+def lookup_area_message(messages: dict[str, str], area: str) -> str | None:
+    """Look up area in a forecast message map, case-insensitively.
+
+    Stored subscriptions use the canonical name and hit the map directly;
+    only other spellings pay for a casefold().
+    """
+    message = messages.get(area)
+    if message is None:
+        message = messages.get(area.casefold())
+    return message
 
 
 # ---------------------------------------------------------------------------
@@ -578,8 +861,7 @@ async def cmd_areas(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if names is None:
         await update.message.reply_text("Sorry, could not fetch area list right now.")
         return
-    text = "Available areas:\n\n" + "\n".join(f"• {n}" for n in names)
-    await update.message.reply_text(text)
+    await update.message.reply_text(_area_names_rendered)
 
 
 async def cmd_subscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -600,8 +882,7 @@ async def cmd_subscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Case-insensitive match
-    valid_areas = {name.lower(): name for name in names}
-    matched_area = valid_areas.get(area_input.lower())
+    matched_area = match_area_name(area_input)
 
     if matched_area is None:
         await update.message.reply_text(
@@ -610,7 +891,13 @@ async def cmd_subscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    inserted = add_subscriber(update.effective_chat.id, matched_area)
+    now = datetime.now(timezone.utc)
+    # Calculate next scheduled time unconditionally - it only depends on now, not the API.
+    # Only a new subscriber's row takes these; existing subscribers keep their schedule.
+    next_scheduled = calculate_next_scheduled_time(now)
+    inserted, is_new_subscriber = await add_subscriber_async(
+        update.effective_chat.id, matched_area, now.isoformat(), next_scheduled
+    )
 
     if inserted is None:
         await update.message.reply_text("Sorry, the subscriber limit has been reached.")
@@ -620,42 +907,36 @@ async def cmd_subscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(f"You're already subscribed to *{matched_area}*.", parse_mode="Markdown")
         return
 
-    # Fetch current forecast and UV index for all subscribed areas (not just the newly added one)
-    data = await fetch_forecast()
-    uv_data = await fetch_uv_index()
-    uv_index = get_current_uv_index(uv_data)
-    all_areas = get_subscriptions(update.effective_chat.id)
+    # Fetch current forecast and UV index for all subscribed areas (not just the newly added one).
+    # The forecast is normally a cache hit from the area-name lookup above; the UV fetch and
+    # subscription read run alongside it rather than after it.
+    data, uv_data, all_areas = await asyncio.gather(
+        fetch_forecast(),
+        fetch_uv_index(),
+        get_subscriptions_async(update.effective_chat.id),
+    )
+    uv_line = format_uv_line(get_current_uv_index(uv_data))
     reply = f"Subscribed to *{matched_area}*! You'll receive forecasts every 2 hours."
 
-    now = datetime.now(timezone.utc)
-    # Calculate next scheduled time unconditionally - it only depends on now, not the API
-    next_scheduled = calculate_next_scheduled_time(now)
-
     if data:
+        forecast_messages = get_forecast_messages(data)
         forecasts = []
         for area in all_areas:
-            forecast = find_area_forecast(data, area)
-            if forecast:
-                forecasts.append(format_forecast_message(area, forecast, uv_index))
+            message = lookup_area_message(forecast_messages, area)
+            if message:
+                forecasts.append(message + uv_line)
         if forecasts:
             reply += "\n\nCurrent forecast:\n" + "\n\n".join(forecasts)
 
     await update.message.reply_text(reply, parse_mode="Markdown")
 
-    # Only set timestamps for new subscribers; existing subscribers keep their schedule
-    conn = get_db_connection()
-    row = conn.execute(
-        "SELECT next_scheduled_at FROM subscribers WHERE chat_id = ?",
-        (update.effective_chat.id,)
-    ).fetchone()
-    conn.close()
-    if row and row[0] is None:
-        update_subscriber_timestamps(update.effective_chat.id, now.isoformat(), next_scheduled)
+    if is_new_subscriber:
+        await schedule_next_update(context.application)
 
 
 async def cmd_unsubscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not context.args:
-        areas = get_subscriptions(update.effective_chat.id)
+        areas = await get_subscriptions_async(update.effective_chat.id)
         if not areas:
             await update.message.reply_text("You have no active subscriptions.")
         else:
@@ -670,9 +951,9 @@ async def cmd_unsubscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
     area_input = " ".join(context.args)
 
     # Case-insensitive match against user's own subscriptions
-    areas = get_subscriptions(update.effective_chat.id)
-    sub_map = {a.lower(): a for a in areas}
-    matched_area = sub_map.get(area_input.lower())
+    areas = await get_subscriptions_async(update.effective_chat.id)
+    area_key = area_input.casefold()
+    matched_area = next((a for a in areas if a.casefold() == area_key), None)
 
     if matched_area is None:
         await update.message.reply_text(
@@ -681,8 +962,8 @@ async def cmd_unsubscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    remove_subscriber(update.effective_chat.id, matched_area)
-    remaining = get_subscriptions(update.effective_chat.id)
+    await remove_subscriber_async(update.effective_chat.id, matched_area)
+    remaining = await get_subscriptions_async(update.effective_chat.id)
     reply = f"Unsubscribed from *{matched_area}*."
     if not remaining:
         reply += " You have no more active subscriptions."
@@ -690,7 +971,7 @@ async def cmd_unsubscribe(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def cmd_weather(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    areas = get_subscriptions(update.effective_chat.id)
+    areas = await get_subscriptions_async(update.effective_chat.id)
     if not areas:
         await update.message.reply_text(
             "You're not subscribed yet.\n"
@@ -698,18 +979,18 @@ async def cmd_weather(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    data = await fetch_forecast()
+    data, uv_data = await asyncio.gather(fetch_forecast(), fetch_uv_index())
     if data is None:
         await update.message.reply_text("Sorry, could not fetch the forecast right now.")
         return
 
-    uv_data = await fetch_uv_index()
-    uv_index = get_current_uv_index(uv_data)
+    uv_line = format_uv_line(get_current_uv_index(uv_data))
+    forecast_messages = get_forecast_messages(data)
     messages = []
     for area in areas:
-        forecast = find_area_forecast(data, area)
-        if forecast:
-            messages.append(format_forecast_message(area, forecast, uv_index))
+        message = lookup_area_message(forecast_messages, area)
+        if message:
+            messages.append(message + uv_line)
 
     if not messages:
         await update.message.reply_text("No forecast data available for your areas right now.")
@@ -731,14 +1012,14 @@ async def cmd_trivia(update: Update, context: ContextTypes.DEFAULT_TYPE):
     chat_id = update.effective_chat.id
     
     if action == "on":
-        set_trivia_enabled(chat_id, True)
+        await set_trivia_enabled_async(chat_id, True)
         
         # Get next trivia to send immediately
-        subscription = get_trivia_subscription(chat_id)
+        subscription = await get_trivia_subscription_async(chat_id)
         last_id = subscription["last_sent_trivia_id"] if subscription else None
 
         # Get next trivia ID (handles non-contiguous IDs)
-        next_id = get_next_trivia_id(last_id)
+        next_id = await get_next_trivia_id_async(last_id)
         if next_id is None:
             await update.message.reply_text(
                 "Weekly trivia enabled. You'll receive trivia every Friday at 10am.\n\n"
@@ -746,15 +1027,15 @@ async def cmd_trivia(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
             return
 
-        trivia = get_trivia_by_id(next_id)
+        trivia = await get_trivia_by_id_async(next_id)
 
         if trivia:
             await update.message.reply_text(format_trivia_message(trivia), parse_mode="Markdown")
-            update_last_sent_trivia(chat_id, next_id)
+            await update_last_sent_trivia_async(chat_id, next_id)
         else:
             await update.message.reply_text("Weekly trivia enabled. You'll receive trivia every Friday at 10am.")
     else:
-        set_trivia_enabled(chat_id, False)
+        await set_trivia_enabled_async(chat_id, False)
         await update.message.reply_text("Weekly trivia disabled.")
 
 
@@ -762,33 +1043,67 @@ async def cmd_trivia(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # Scheduled job: push trivia to enabled subscribers
 # ---------------------------------------------------------------------------
 
+# Maximum number of Telegram sends in flight at once during a broadcast. This
+# only bounds concurrency; the application's AIORateLimiter (see main) paces
+# sends to Telegram's ~30 messages/second limit.
+BROADCAST_CONCURRENCY = 25
+# How many times the rate limiter retries a request Telegram answered with a
+# 429, after waiting the retry_after it returned
+TELEGRAM_MAX_RETRIES = 2
+
+
 async def send_weekly_trivia(app: Application):
     """Send trivia to all subscribers who have trivia enabled."""
-    subscribers = get_trivia_enabled_subscribers()
+    subscribers = await get_trivia_enabled_subscribers_async()
     if not subscribers:
         logger.info("No subscribers with trivia enabled")
         return
 
     # Pre-fetch trivia IDs once (handles non-contiguous IDs)
-    trivia_ids = get_all_trivia_ids()
+    trivia_ids = await get_all_trivia_ids_async()
     if not trivia_ids:
         logger.warning("No trivia available to send")
         return
 
-    for chat_id, last_id in subscribers:
-        # Get next trivia ID (handles non-contiguous IDs)
-        next_id = get_next_trivia_id(last_id)
-        if next_id is None:
-            continue
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
 
-        trivia = get_trivia_by_id(next_id)
-        if trivia:
+    async def send_one(chat_id: int, trivia_id: int, text: str) -> bool:
+        async with semaphore:
             try:
-                await app.bot.send_message(chat_id=chat_id, text=format_trivia_message(trivia), parse_mode="Markdown")
-                update_last_sent_trivia(chat_id, next_id)
-                logger.info("Sent trivia id=%d to chat_id=%s", next_id, chat_id)
+                try:
+                    await app.bot.send_message(chat_id=chat_id, text=text, parse_mode="Markdown")
+                except RetryAfter as e:
+                    # Unlike forecasts, a failed trivia send is not retried until next
+                    # week, so wait out Telegram's limit once more before giving up
+                    logger.warning("Rate limited sending trivia to chat_id=%s, retrying in %ss",
+                                   chat_id, e.retry_after)
+                    await asyncio.sleep(e.retry_after)
+                    await app.bot.send_message(chat_id=chat_id, text=text, parse_mode="Markdown")
+                logger.info("Sent trivia id=%d to chat_id=%s", trivia_id, chat_id)
+                return True
             except Exception:
                 logger.exception("Failed to send trivia to chat_id=%s", chat_id)
+                return False
+
+    # Work out each chat's next trivia (handles non-contiguous IDs), then load
+    # all the distinct items needed in a single query
+    next_ids = [(chat_id, get_next_trivia_id(last_id, trivia_ids)) for chat_id, last_id in subscribers]
+    trivia_by_id = await get_trivia_by_ids_async({next_id for _, next_id in next_ids})
+
+    pending = []
+    sends = []
+    for chat_id, next_id in next_ids:
+        trivia = trivia_by_id.get(next_id)
+        if trivia:
+            pending.append((next_id, chat_id))
+            sends.append(send_one(chat_id, next_id, format_trivia_message(trivia)))
+
+    results = await asyncio.gather(*sends)
+
+    # Record progress for every successful send in one transaction
+    sent = [update for update, ok in zip(pending, results) if ok]
+    if sent:
+        await update_last_sent_trivia_many_async(sent)
 
 
 # ---------------------------------------------------------------------------
@@ -806,9 +1121,8 @@ async def send_scheduled_updates(app: Application, startup: bool = False):
     now_iso = now.isoformat()
     
     # Get current forecast and UV data
-    data = await fetch_forecast()
-    uv_data = await fetch_uv_index()
-    uv_index = get_current_uv_index(uv_data)
+    data, uv_data = await asyncio.gather(fetch_forecast(), fetch_uv_index())
+    uv_line = format_uv_line(get_current_uv_index(uv_data))
     if data is None:
         if not startup:
             logger.warning("Scheduled update: could not fetch forecast")
@@ -827,31 +1141,92 @@ async def send_scheduled_updates(app: Application, startup: bool = False):
             return
 
     # Get subscribers who need an update
-    subscribers = get_overdue_subscribers(now_iso)
+    subscribers = await get_overdue_subscribers_async(now_iso)
     if not subscribers:
         return
 
     next_scheduled = calculate_next_scheduled_time(now)
+    forecast_messages = get_forecast_messages(data)
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async def send_one(chat_id: int, areas: list[str], text: str) -> bool:
+        async with semaphore:
+            try:
+                await app.bot.send_message(chat_id=chat_id, text=text, parse_mode="Markdown")
+                logger.info("Sent forecast to chat_id=%s areas=%s, next scheduled: %s",
+                            chat_id, areas, next_scheduled)
+                return True
+            except Exception:
+                logger.exception("Failed to send update to chat_id=%s", chat_id)
+                return False
 
+    chat_ids = []
+    sends = []
     for chat_id, areas in subscribers:
         messages = []
         for area in areas:
-            forecast = find_area_forecast(data, area)
-            if forecast:
-                messages.append(format_forecast_message(area, forecast, uv_index))
+            message = lookup_area_message(forecast_messages, area)
+            if message:
+                messages.append(message + uv_line)
 
         if not messages:
             continue
 
-        text = "\n\n".join(messages)
+        chat_ids.append(chat_id)
+        sends.append(send_one(chat_id, areas, "\n\n".join(messages)))
+
+    results = await asyncio.gather(*sends)
+
+    # Update timestamps for every successful send in one transaction
+    sent = [(validity_start, next_scheduled, chat_id) for chat_id, ok in zip(chat_ids, results) if ok]
+    if sent:
+        await update_subscriber_timestamps_many_async(sent)
+
+
+_scheduler: AsyncIOScheduler | None = None
+# Serialises forecast runs so the one-shot and backstop jobs never broadcast at once
+_forecast_run_lock = asyncio.Lock()
+# Delay before retrying subscribers a run left unserved (no forecast, failed send)
+FORECAST_RETRY_SECONDS = 60
+
+
+async def run_forecast_job(app: Application, startup: bool = False) -> None:
+    """Send due forecasts, then schedule a wake-up for the next due subscriber."""
+    async with _forecast_run_lock:
         try:
-            await app.bot.send_message(chat_id=chat_id, text=text, parse_mode="Markdown")
-            # Update timestamps after successful send
-            update_subscriber_timestamps(chat_id, validity_start, next_scheduled)
-            logger.info("Sent forecast to chat_id=%s areas=%s, next scheduled: %s",
-                        chat_id, areas, next_scheduled)
-        except Exception:
-            logger.exception("Failed to send update to chat_id=%s", chat_id)
+            await send_scheduled_updates(app, startup=startup)
+        finally:
+            await schedule_next_update(app)
+
+
+async def schedule_next_update(app: Application) -> None:
+    """Schedule a one-shot forecast run for when the next subscriber is due.
+
+    Replaces any previously scheduled one-shot run. If a run left subscribers
+    due (the forecast fetch failed, the startup forecast had expired, or a send
+    failed), retries after FORECAST_RETRY_SECONDS, as the old per-minute poll did.
+    """
+    if _scheduler is None:
+        return
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    next_iso = await get_next_scheduled_time_async(now_iso)
+    if next_iso is None:
+        return
+    if next_iso == now_iso:
+        run_date = now + timedelta(seconds=FORECAST_RETRY_SECONDS)
+    else:
+        run_date = datetime.fromisoformat(next_iso)
+    _scheduler.add_job(
+        run_forecast_job,
+        trigger="date",
+        run_date=run_date,
+        args=[app],
+        id="forecast_next",
+        replace_existing=True,
+        misfire_grace_time=None,  # Run however late rather than skip a window
+    )
+    logger.info("Next forecast run scheduled for %s", run_date.isoformat())
 
 
 # ---------------------------------------------------------------------------
@@ -860,14 +1235,24 @@ async def send_scheduled_updates(app: Application, startup: bool = False):
 
 def make_post_init():
     async def post_init(app: Application):
-        scheduler = AsyncIOScheduler()
+        global _scheduler
+        get_http_client()
+
+        scheduler = _scheduler = AsyncIOScheduler()
+        # Forecast runs are scheduled one at a time for the next due subscriber
+        # (see schedule_next_update), with a short retry while anyone is left
+        # due; this hourly job is a safety net in case that chain is lost.
         scheduler.add_job(
-            send_scheduled_updates,
+            run_forecast_job,
             trigger="interval",
-            minutes=1,  # Check every minute for due subscribers
+            hours=1,
             args=[app],
             id="forecast_scheduler",
             replace_existing=True,
+            # Collapse missed runs and never overlap a slow broadcast
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=30,
         )
         # Schedule weekly trivia for Friday at 10:00 AM SGT (02:00 UTC)
         scheduler.add_job(
@@ -879,19 +1264,42 @@ def make_post_init():
             args=[app],
             id="trivia_scheduler",
             replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=30,
         )
         scheduler.start()
         
-        # Check for overdue subscribers on startup
+        # Check for overdue subscribers on startup and schedule the next run
         logger.info("Running startup check for overdue subscribers...")
-        await send_scheduled_updates(app, startup=True)
+        await run_forecast_job(app, startup=True)
     return post_init
 
 
+async def post_shutdown(app: Application) -> None:
+    """Stop the scheduler, then close the shared HTTP client and database connection."""
+    global _http_client, _scheduler
+    # Stop scheduled jobs first so none fires against a closed client or database
+    if _scheduler is not None:
+        _scheduler.shutdown(wait=False)
+        _scheduler = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    close_db()
+
+
 def main():
     init_db()
 
-    app = Application.builder().token(TELEGRAM_BOT_TOKEN).post_init(make_post_init()).build()
+    app = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .rate_limiter(AIORateLimiter(max_retries=TELEGRAM_MAX_RETRIES))
+        .post_init(make_post_init())
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("help", cmd_help))
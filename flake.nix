@@ -15,7 +15,10 @@
 
         pythonEnv = python.withPackages (ps: with ps; [
           python-telegram-bot
+          aiolimiter
           httpx
+          h2
+          orjson
           apscheduler
           python-dotenv
         ]);
@@ -33,7 +36,10 @@
 
           propagatedBuildInputs = with pythonPkgs; [
             python-telegram-bot
+            aiolimiter
             httpx
+            h2
+            orjson
             apscheduler
             python-dotenv
           ];
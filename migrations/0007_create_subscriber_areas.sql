@@ -0,0 +1,18 @@
+-- Migration 0007: Normalize subscriber areas into a child table
+-- Moves the JSON areas array on subscribers to one row per (chat_id, area)
+-- so adding or removing an area is a single-row INSERT or DELETE
+
+CREATE TABLE subscriber_areas (
+    chat_id INTEGER NOT NULL,
+    area TEXT NOT NULL,
+    PRIMARY KEY (chat_id, area),
+    FOREIGN KEY (chat_id) REFERENCES subscribers(chat_id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO subscriber_areas (chat_id, area)
+SELECT subscribers.chat_id, json_each.value
+FROM subscribers, json_each(subscribers.areas);
+
+ALTER TABLE subscribers DROP COLUMN areas;
+
+PRAGMA user_version=7;
@@ -0,0 +1,10 @@
+-- Migration 0008: Add indexes for the scheduled jobs
+-- get_next_scheduled_time() and get_overdue_subscribers() filter on
+-- next_scheduled_at to find due subscribers, and
+-- get_trivia_enabled_subscribers() only reads rows with trivia enabled
+
+CREATE INDEX idx_subscribers_next_scheduled ON subscribers(next_scheduled_at);
+
+CREATE INDEX idx_trivia_enabled ON trivia_subscriptions(trivia_enabled) WHERE trivia_enabled = 1;
+
+PRAGMA user_version=8;
@@ -23,6 +23,10 @@ load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "subscribers.db")
 TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+# Maximum number of sends in flight at once. This bounds concurrency, not the
+# send rate; a 429 from Telegram is retried after its retry_after instead.
+SEND_CONCURRENCY = 25
+SEND_ATTEMPTS = 2
 
 
 def get_all_chat_ids() -> list[int]:
@@ -31,24 +35,50 @@ def get_all_chat_ids() -> list[int]:
         print(f"Database not found at {DB_PATH}, skipping announcement.")
         return []
     conn = sqlite3.connect(DB_PATH)
-    rows = conn.execute("SELECT DISTINCT chat_id FROM subscribers").fetchall()
+    # Return the single column directly instead of wrapping each row in a tuple
+    conn.row_factory = lambda _cursor, row: row[0]
+    # chat_id is the primary key, so the rows are already unique
+    chat_ids = list(conn.execute("SELECT chat_id FROM subscribers"))
     conn.close()
-    return [row[0] for row in rows]
+    return chat_ids
 
 
-async def send_announcement(chat_id: int, message: str, client: httpx.AsyncClient):
-    """Send a message to a single chat_id via the Telegram Bot API."""
+async def send_announcement(chat_id: int, message: str, client: httpx.AsyncClient,
+                            semaphore: asyncio.Semaphore):
+    """Send a message to a single chat_id via the Telegram Bot API.
+
+    If Telegram rate-limits the request (429), waits for its retry_after and tries again.
+    """
     url = TELEGRAM_API_URL.format(token=TELEGRAM_BOT_TOKEN)
+    async with semaphore:
+        for attempt in range(1, SEND_ATTEMPTS + 1):
+            try:
+                resp = await client.post(url, json={
+                    "chat_id": chat_id,
+                    "text": message,
+                    "parse_mode": "Markdown",
+                }, timeout=10)
+                resp.raise_for_status()
+                print(f"  Sent to chat_id={chat_id}")
+                return
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 429 or attempt == SEND_ATTEMPTS:
+                    print(f"  Failed to send to chat_id={chat_id}: {e}")
+                    return
+                retry_after = get_retry_after(e.response)
+                print(f"  Rate limited on chat_id={chat_id}, retrying in {retry_after}s")
+                await asyncio.sleep(retry_after)
+            except Exception as e:
+                print(f"  Failed to send to chat_id={chat_id}: {e}")
+                return
+
+
+def get_retry_after(resp: httpx.Response) -> int:
+    """Return the retry_after seconds from a Telegram 429 response, defaulting to 1."""
     try:
-        resp = await client.post(url, json={
-            "chat_id": chat_id,
-            "text": message,
-            "parse_mode": "Markdown",
-        }, timeout=10)
-        resp.raise_for_status()
-        print(f"  Sent to chat_id={chat_id}")
-    except Exception as e:
-        print(f"  Failed to send to chat_id={chat_id}: {e}")
+        return int(resp.json()["parameters"]["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        return 1
 
 
 async def main(version: str, release_notes: str):
@@ -64,8 +94,13 @@ async def main(version: str, release_notes: str):
     message = build_message(version, release_notes)
 
     print(f"Sending release announcement to {len(chat_ids)} subscriber(s)...")
-    async with httpx.AsyncClient() as client:
-        tasks = [send_announcement(chat_id, message, client) for chat_id in chat_ids]
+    semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+    # HTTP/2 lets the concurrent sends share one connection to Telegram
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=SEND_CONCURRENCY),
+    ) as client:
+        tasks = [send_announcement(chat_id, message, client, semaphore) for chat_id in chat_ids]
         await asyncio.gather(*tasks)
     print("Announcement sent.")
 